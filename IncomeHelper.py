@@ -14,12 +14,187 @@ Date: 2025-11-29
 Version: 1.0
 """
 
+from __future__ import annotations
+
+import bisect
+import collections.abc
+import functools
+import importlib.util
 import math
+import operator
 import os
-from typing import List, Dict, Tuple, Optional
+import sys
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, List, Dict, Tuple, Optional, Union
+
+import numpy as np
+
+# pandas, matplotlib and numba are imported lazily inside the functions that use them,
+# so tax-only callers do not pay their import cost
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Optional seaborn support is looked up once, without importing it
+_HAS_SEABORN = importlib.util.find_spec("seaborn") is not None
+
+# xlsxwriter is the faster Excel writer; openpyxl is the fallback engine
+_HAS_XLSXWRITER = importlib.util.find_spec("xlsxwriter") is not None
+
+
+def _pyplot():
+    """
+    Import matplotlib.pyplot for file-only plotting.
+    
+    Selects the non-interactive Agg backend before pyplot is first imported, so no GUI
+    backend is probed. An explicit MPLBACKEND setting, or a pyplot already imported by
+    the caller, is left untouched.
+    
+    Returns:
+        The matplotlib.pyplot module.
+    """
+    if "matplotlib.pyplot" not in sys.modules and not os.environ.get("MPLBACKEND"):
+        import matplotlib
+        matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    return plt
+
 
-import pandas as pd
-import matplotlib.pyplot as plt
+def _lazy_njit(**options):
+    """
+    Decorator that compiles a function with numba.njit on its first call.
+    
+    Defers importing numba (and compiling) until the kernel is actually used. When numba
+    is not installed the function runs as plain Python.
+    
+    Args:
+        **options: Keyword arguments forwarded to numba.njit (e.g., cache=True).
+    """
+    def decorator(func):
+        compiled = None
+
+        @functools.wraps(func)
+        def wrapper(*args):
+            nonlocal compiled
+            if compiled is None:
+                try:
+                    from numba import njit
+                except ImportError:
+                    compiled = func
+                else:
+                    compiled = njit(**options)(func)
+            return compiled(*args)
+        return wrapper
+    return decorator
+
+
+# Record layout of one projected year; values keep full precision and are rounded
+# only when exported (see _ROUND_DECIMALS)
+RESULT_DTYPE = np.dtype([
+    ("year", np.int64),
+    ("gross_yearly", np.float64),
+    ("gross_monthly", np.float64),
+    ("tax_yearly", np.float64),
+    ("tax_monthly", np.float64),
+    ("net_salary_yearly", np.float64),
+    ("net_monthly", np.float64),
+    ("common_ded_month", np.float64),
+    ("other_deductions", np.float64),
+    ("total_invest_yearly", np.float64),
+    ("monthly_investment", np.float64),
+    ("salary_left_month", np.float64),
+    ("invest_percentage", np.float64),
+    ("remarks", "U4"),
+    ("running_invest_total", np.float64),
+    ("cumulative_return", np.float64),
+    ("return_percentage", np.float64),
+])
+
+# Export rounding: percentages keep two decimals, all other amounts are whole rupees
+_ROUND_DECIMALS = {"invest_percentage": 2, "return_percentage": 2}
+_AMOUNT_FIELDS = tuple(
+    name for name in RESULT_DTYPE.names if name not in ("year", "remarks", *_ROUND_DECIMALS)
+)
+
+
+class YearResult(collections.abc.Mapping):
+    """
+    Metrics of a single projected year, as returned by SalaryInvestmentProjector.project_year().
+    
+    A slotted record with the fields of RESULT_DTYPE, avoiding a per-year dict. It is a
+    Mapping that also allows assigning existing fields (e.g. result["year"] = y), so it
+    supports get(), items(), values(), `in` and value equality, and pandas builds rows from
+    it like from a dictionary, e.g. result["gross_yearly"], dict(result) or
+    pd.DataFrame([result]). Use asdict() where a real dict is required, such as json.dumps().
+    """
+    __slots__ = RESULT_DTYPE.names
+
+    def __init__(self, **fields: float) -> None:
+        for name in self.__slots__:
+            setattr(self, name, fields[name])
+
+    def __getitem__(self, key: str) -> float:
+        if key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __setitem__(self, key: str, value: float) -> None:
+        if key not in self.__slots__:
+            raise KeyError(key)
+        setattr(self, key, value)
+
+    def __iter__(self):
+        return iter(self.__slots__)
+
+    def __len__(self) -> int:
+        return len(self.__slots__)
+
+    def __repr__(self) -> str:
+        return f"YearResult({self.asdict()})"
+
+    def asdict(self) -> Dict[str, float]:
+        """Return the metrics as a plain dictionary."""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+# Memoize computed taxes; capped salaries and repeated scenarios hit the same incomes.
+# Keyed on the slab tables and tax parameters rather than held per instance, so
+# TaxCalculator stays picklable and free of reference cycles.
+@functools.lru_cache(maxsize=1024)
+def _slab_tax(
+    edges: Tuple[float, ...],
+    bases: Tuple[float, ...],
+    rates: Tuple[float, ...],
+    cess_rate: float,
+    std_deduction: float,
+    gross_yearly: float
+) -> float:
+    """
+    Slab computation behind TaxCalculator.compute_tax().
+    
+    Args:
+        edges: Lower edge of each slab.
+        bases: Cumulative tax due at each slab's lower edge.
+        rates: Tax rate of each slab.
+        cess_rate: Cess rate applied on the computed tax.
+        std_deduction: Standard deduction subtracted from the gross income.
+        gross_yearly: Gross yearly salary in INR.
+    
+    Returns:
+        Total tax amount including cess, in INR.
+    """
+    # Calculate taxable income after standard deduction
+    taxable_income = max(0.0, gross_yearly - std_deduction)
+    if taxable_income <= 0:
+        return 0.0
+    
+    # Locate the slab by binary search and add its share to the tax due at its lower edge
+    i = bisect.bisect_right(edges, taxable_income) - 1
+    tax = bases[i] + (taxable_income - edges[i]) * rates[i]
+    
+    # Apply cess (additional tax on computed tax)
+    tax += tax * cess_rate
+    return tax
 
 
 class TaxCalculator:
@@ -27,6 +202,9 @@ class TaxCalculator:
     Tax calculator for computing income tax based on progressive tax slabs and cess.
     
     Supports Indian tax system with configurable tax slabs, standard deduction, and cess rate.
+    Slab tables are precomputed at construction, so create a new TaxCalculator to change
+    the slabs. Computed taxes are memoized in a module-level cache keyed on the tax
+    parameters, which keeps instances picklable and lets equal calculators share results.
     Attributes:
         STD_DEDUCTION (float): Standard deduction amount (default: ₹50,000).
         CESS_RATE (float): Cess rate applied on computed tax (default: 4%).
@@ -62,6 +240,24 @@ class TaxCalculator:
         self.cess_rate = cess_rate if cess_rate is not None else self.CESS_RATE
         self.std_deduction = std_deduction if std_deduction is not None else self.STD_DEDUCTION
 
+        # Precompute slab lower edges, widths, rates and the cumulative tax due at each edge
+        edges, widths, rates, bases = [0.0], [], [], [0.0]
+        for slab_amount, rate in self.slabs:
+            widths.append(float(slab_amount))
+            rates.append(float(rate))
+            if math.isinf(slab_amount):
+                break
+            edges.append(edges[-1] + slab_amount)
+            bases.append(bases[-1] + slab_amount * rate)
+        else:
+            # Income above the last finite slab is not taxed
+            widths.append(math.inf)
+            rates.append(0.0)
+        self._edges = tuple(edges[:len(rates)])
+        self._widths = tuple(widths)
+        self._rates = tuple(rates)
+        self._bases = tuple(bases[:len(rates)])
+
     def compute_tax(self, gross_yearly: float) -> float:
         """
         Compute total income tax for a given gross yearly income.
@@ -80,24 +276,133 @@ class TaxCalculator:
             >>> tax = calc.compute_tax(1_000_000)
             >>> print(f"Tax for ₹1,000,000: ₹{tax:,.0f}")
         """
-        # Calculate taxable income after standard deduction
-        taxable_income = max(0.0, gross_yearly - self.std_deduction)
-        if taxable_income <= 0:
-            return 0.0
-        
-        # Apply progressive tax slabs
-        remaining = taxable_income
-        tax = 0.0
-        for slab_amount, rate in self.slabs:
-            take = min(remaining, slab_amount)
-            if take <= 0:
-                break
-            tax += take * rate
-            remaining -= take
+        return _slab_tax(
+            self._edges, self._bases, self._rates, self.cess_rate, self.std_deduction,
+            float(gross_yearly)
+        )
+
+    def compute_tax_vec(self, gross_yearly: np.ndarray) -> np.ndarray:
+        """
+        Compute total income tax for an array of gross yearly incomes.
+        
+        Vectorized counterpart of compute_tax(): the slab of every income is located with a
+        single np.searchsorted over the precomputed slab edges, after which the tax is the
+        cumulative tax at that edge plus one multiply-add.
         
-        # Apply cess (additional tax on computed tax)
-        tax += tax * self.cess_rate
-        return tax
+        Args:
+            gross_yearly: Array of gross yearly salaries in INR.
+        
+        Returns:
+            Array of the same shape with the total tax (including cess) for each income.
+        """
+        edges = np.asarray(self._edges)
+        rates = np.asarray(self._rates)
+        bases = np.asarray(self._bases)
+
+        taxable = np.maximum(np.asarray(gross_yearly, dtype=float) - self.std_deduction, 0.0)
+        i = np.searchsorted(edges, taxable, side="right") - 1
+        tax = bases[i] + (taxable - edges[i]) * rates[i]
+        return tax * (1 + self.cess_rate)
+
+
+# All fast-math flags except the no-inf/no-nan assumptions: the top slab width is infinite
+_FASTMATH_FLAGS = {"nsz", "arcp", "contract", "afn", "reassoc"}
+
+
+@_lazy_njit(cache=True, fastmath=_FASTMATH_FLAGS)
+def _project_year_kernel(
+    gross_yearly: float,
+    monthly_investment: float,
+    other_deductions: float,
+    running_invest_total: float,
+    cumulative_return: float,
+    expected_return: float,
+    prof_tax_month: float,
+    invest_monthly_cap: float,
+    edges: Tuple[float, ...],
+    widths: Tuple[float, ...],
+    rates: Tuple[float, ...],
+    cess_rate: float,
+    std_deduction: float
+) -> Tuple[float, ...]:
+    """
+    Numeric core of SalaryInvestmentProjector.project_year() on plain floats.
+    
+    Compiled with numba on first use when available. Tax is computed inline and branch-free from the
+    slab tables precomputed by TaxCalculator: the income within each slab is clipped to
+    the slab width and weighted by the slab rate.
+    
+    Returns:
+        Tuple of (gross_monthly, tax_yearly, tax_monthly, net_salary_yearly, net_monthly,
+        common_ded_month, total_invest_yearly, monthly_investment_capped, salary_left_month,
+        invest_percentage, running_invest_total, cumulative_return, return_percentage).
+    """
+    # Calculate salary components
+    basic = 0.40 * gross_yearly
+    emp_pf = 0.12 * basic
+    employer_pf = 0.12 * basic
+    prof_tax_yearly = prof_tax_month * 12
+
+    # Compute income tax as a clipped-width dot product over the slabs
+    taxable_income = max(gross_yearly - std_deduction, 0.0)
+    tax_yearly = 0.0
+    for i in range(len(edges)):
+        tax_yearly += min(max(taxable_income - edges[i], 0.0), widths[i]) * rates[i]
+    tax_yearly *= 1 + cess_rate
+
+    # Calculate deductions, net salary and monthly breakdown
+    common_ded_month = (emp_pf + employer_pf + prof_tax_yearly) / 12
+    net_salary_yearly = gross_yearly - tax_yearly
+    net_monthly = net_salary_yearly / 12
+    gross_monthly = gross_yearly / 12
+    tax_monthly = tax_yearly / 12
+    monthly_investment_capped = min(monthly_investment, invest_monthly_cap)
+
+    salary_left_month = net_monthly - monthly_investment_capped - common_ded_month - other_deductions
+    invest_percentage = (monthly_investment_capped / net_monthly * 100.0) if net_monthly > 0 else 0.0
+
+    # Update investment totals and compound returns
+    total_invest_yearly = monthly_investment_capped * 12
+    running_invest_total += total_invest_yearly
+    cumulative_return = (cumulative_return + total_invest_yearly) * (1 + expected_return / 100)
+    return_percentage = ((cumulative_return - running_invest_total) /
+                         running_invest_total * 100) if running_invest_total > 0 else 0.0
+
+    return (gross_monthly, tax_yearly, tax_monthly, net_salary_yearly, net_monthly,
+            common_ded_month, total_invest_yearly, monthly_investment_capped, salary_left_month,
+            invest_percentage, running_invest_total, cumulative_return, return_percentage)
+
+
+def _capped_growth(start: np.ndarray, growth: Union[float, np.ndarray], k: np.ndarray, cap: float) -> np.ndarray:
+    """
+    Closed form of the capped growth recurrence x_k = min(x_{k-1} * growth, cap), x_0 = start.
+    
+    Unrolled, x_k = min(start * growth^k, cap * min(1, growth^(k-1))) for k >= 1: once the
+    cap is hit the value keeps growing (or shrinking) from the cap. This matches the
+    recurrence for any positive growth factor, including negative hikes (growth < 1)
+    with a start above the cap. The first year is returned as start, uncapped.
+    
+    Args:
+        start: Starting values, shape (S, 1).
+        growth: Growth factor 1 + rate, scalar or shape (S, 1).
+        k: Year offsets 0..years-1.
+        cap: Cap applied from the second year onward.
+    
+    Returns:
+        Array of shape (S, len(k)).
+        
+    Examples:
+        >>> _capped_growth(np.array([[6_000_000.0]]), 0.9, np.arange(4), 5_000_000).round()
+        array([[6000000., 5000000., 4500000., 4050000.]])
+        >>> _capped_growth(np.array([[4_000_000.0]]), 1.5, np.arange(3), 5_000_000).round()
+        array([[4000000., 5000000., 5000000.]])
+    """
+    factors = np.power(growth, k)
+    values = start * factors
+    if len(k) > 1:
+        cap_factors = np.minimum(1.0, np.power(growth, k[1:] - 1))
+        values[:, 1:] = np.minimum(values[:, 1:], cap * cap_factors)
+    return values
 
 
 class SalaryInvestmentProjector:
@@ -149,7 +454,7 @@ class SalaryInvestmentProjector:
         running_invest_total: float,
         cumulative_return: float,
         expected_return: float
-    ) -> Tuple[Dict[str, float], float, float]:
+    ) -> Tuple[YearResult, float, float]:
         """
         Project financial metrics for a single year.
         
@@ -166,68 +471,232 @@ class SalaryInvestmentProjector:
         
         Returns:
             Tuple containing:
-                - Dictionary with year-wise financial metrics (gross, net, tax, investment, etc.)
+                - YearResult with year-wise financial metrics (gross, net, tax, investment, etc.)
                 - Updated running_invest_total
                 - Updated cumulative_return
         """
-        # Calculate salary components
-        basic = 0.40 * gross_yearly  # Basic salary as 40% of gross
-        emp_pf = 0.12 * basic  # Employee provident fund
-        employer_pf = 0.12 * basic  # Employer provident fund contribution
-        prof_tax_yearly = self.PROF_TAX_MONTH * 12  # Annual professional tax
-        tax_yearly = self.tax_calc.compute_tax(gross_yearly)  # Compute income tax
-
-        # Calculate total common deductions (excluding voluntary investment)
-        common_ded_yearly = emp_pf + employer_pf + prof_tax_yearly
-        common_ded_month = common_ded_yearly / 12
-
-        # Calculate net salary
-        net_salary_yearly = gross_yearly - tax_yearly
-        net_monthly = net_salary_yearly / 12
+        # Run the numeric core on plain floats (numba-compiled when available)
+        tax_calc = self.tax_calc
+        (gross_monthly, tax_yearly, tax_monthly, net_salary_yearly, net_monthly,
+         common_ded_month, total_invest_yearly, monthly_investment_capped, salary_left_month,
+         invest_percentage, running_invest_total, cumulative_return,
+         return_percentage) = _project_year_kernel(
+            float(gross_yearly), float(monthly_investment), float(other_deductions),
+            float(running_invest_total), float(cumulative_return), float(expected_return),
+            float(self.PROF_TAX_MONTH), float(self.invest_monthly_cap),
+            tax_calc._edges, tax_calc._widths, tax_calc._rates,
+            float(tax_calc.cess_rate), float(tax_calc.std_deduction)
+        )
 
-        # Calculate monthly breakdown
-        gross_monthly = gross_yearly / 12
-        tax_monthly = tax_yearly / 12
-        monthly_investment_capped = min(monthly_investment, self.invest_monthly_cap)
+        # Determine investment intensity remark
+        remarks = "High" if invest_percentage > 40 else "Good"
 
-        # Calculate remaining salary after all deductions and investments
-        salary_left_month = net_monthly - monthly_investment_capped - common_ded_month - other_deductions
-        invest_percentage = (monthly_investment_capped / net_monthly * 100.0) if net_monthly > 0 else 0
+        # Build result record with all metrics (full precision; rounded when exported)
+        result = YearResult(
+            year=0,
+            gross_yearly=gross_yearly,
+            gross_monthly=gross_monthly,
+            tax_yearly=tax_yearly,
+            tax_monthly=tax_monthly,
+            net_salary_yearly=net_salary_yearly,
+            net_monthly=net_monthly,
+            common_ded_month=common_ded_month,
+            other_deductions=other_deductions,
+            total_invest_yearly=total_invest_yearly,
+            monthly_investment=monthly_investment_capped,
+            salary_left_month=salary_left_month,
+            invest_percentage=invest_percentage,
+            remarks=remarks,
+            running_invest_total=running_invest_total,
+            cumulative_return=cumulative_return,
+            return_percentage=return_percentage
+        )
 
-        # Update investment totals
-        total_invest_yearly = monthly_investment_capped * 12
-        running_invest_total += total_invest_yearly
+        return result, running_invest_total, cumulative_return
 
-        # Calculate compound returns
-        cumulative_return = (cumulative_return + total_invest_yearly) * (1 + expected_return / 100)
-        return_percentage = ((cumulative_return - running_invest_total) /
-                             running_invest_total * 100) if running_invest_total > 0 else 0
+    def run_projection_frame(
+        self,
+        start_gross: float,
+        years: int,
+        start_monthly_investment: float,
+        invest_hike_percent: float,
+        expected_return: float,
+        other_deductions: float
+    ) -> pd.DataFrame:
+        """
+        Run multi-year salary and investment projection, returning a DataFrame.
+        
+        Projects financial metrics for all years at once using NumPy arrays: salary and
+        investment follow capped geometric series, tax is computed with the vectorized slab
+        calculation, and compound returns use the closed form of the yearly recurrence.
+        
+        Args:
+            start_gross: Starting gross yearly salary in INR.
+            years: Number of years to project (positive integer).
+            start_monthly_investment: Starting monthly investment amount in INR.
+            invest_hike_percent: Annual investment increase rate as a percentage (e.g., 10 for 10%).
+            expected_return: Expected annual portfolio return as a percentage (e.g., 12 for 12%).
+            other_deductions: Fixed monthly deductions in INR (e.g., loan EMI).
+        
+        Returns:
+            DataFrame with one row per year and one column per metric (see RESULT_DTYPE).
+        """
+        import pandas as pd
 
-        # Determine investment intensity remark
-        remarks = "High" if invest_percentage > 40 else "Good"
+        out = self._project_records(
+            start_gross, years, start_monthly_investment,
+            invest_hike_percent, expected_return, other_deductions
+        )
+        return pd.DataFrame(out[0])
+
+    def run_projection_batch(
+        self,
+        start_gross: Union[np.ndarray, float],
+        years: int,
+        start_monthly_investment: Union[np.ndarray, float],
+        invest_hike_percent: Union[np.ndarray, float],
+        expected_return: Union[np.ndarray, float],
+        other_deductions: Union[np.ndarray, float]
+    ) -> pd.DataFrame:
+        """
+        Run many projections at once for sensitivity analysis.
+        
+        Scenario parameters may be scalars or arrays; they are broadcast against each other
+        so that every scenario is projected in a single 2D (scenario x year) computation.
+        
+        Args:
+            start_gross: Starting gross yearly salary per scenario, in INR.
+            years: Number of years to project (shared by all scenarios).
+            start_monthly_investment: Starting monthly investment per scenario, in INR.
+            invest_hike_percent: Annual investment increase per scenario, as a percentage.
+            expected_return: Expected annual portfolio return per scenario, as a percentage.
+            other_deductions: Fixed monthly deductions per scenario, in INR.
+        
+        Returns:
+            DataFrame indexed by (scenario, year) with the same metric columns as
+            run_projection_frame(). Scenarios are numbered in broadcast (row-major) order.
+            
+        Examples:
+            >>> projector = SalaryInvestmentProjector()
+            >>> grid = projector.run_projection_batch(
+            ...     start_gross=1_000_000,
+            ...     years=20,
+            ...     start_monthly_investment=50_000,
+            ...     invest_hike_percent=10,
+            ...     expected_return=np.array([8, 10, 12]),
+            ...     other_deductions=5_000
+            ... )
+            >>> print(grid.loc[2, "cumulative_return"].iloc[-1])
+        """
+        import pandas as pd
+
+        out = self._project_records(
+            start_gross, years, start_monthly_investment,
+            invest_hike_percent, expected_return, other_deductions
+        )
+        df = pd.DataFrame(out.ravel())
+        df.insert(0, "scenario", np.repeat(np.arange(out.shape[0]), out.shape[1]))
+        return df.set_index(["scenario", "year"])
+
+    def _project_records(
+        self,
+        start_gross: Union[np.ndarray, float],
+        years: int,
+        start_monthly_investment: Union[np.ndarray, float],
+        invest_hike_percent: Union[np.ndarray, float],
+        expected_return: Union[np.ndarray, float],
+        other_deductions: Union[np.ndarray, float]
+    ) -> np.ndarray:
+        """
+        Vectorized projection core shared by run_projection_frame() and run_projection_batch().
+        
+        Scenario parameters are broadcast against each other and flattened to a column of
+        S scenarios, so every intermediate series has shape (S, years).
+        
+        Returns:
+            Record array of shape (S, years) with dtype RESULT_DTYPE.
+        """
+        params = np.broadcast_arrays(*(
+            np.asarray(x, dtype=float) for x in (
+                start_gross, start_monthly_investment, invest_hike_percent,
+                expected_return, other_deductions
+            )
+        ))
+        (start_gross, start_monthly_investment, invest_hike_percent,
+         expected_return, other_deductions) = (x.reshape(-1, 1) for x in params)
+        k = np.arange(max(int(years), 0))
+        tax_calc = self.tax_calc
+        salary_cap = self.salary_cap
+
+        # Compound return factor table q^k, built once
+        q = 1 + expected_return / 100
+        return_factors = np.power(q, k)
+
+        # Salary and investment grow geometrically, capped from the second year onward;
+        # the invested amount is also capped in the first year, as in project_year()
+        gross = _capped_growth(start_gross, 1 + self.salary_hike_rate, k, salary_cap)
+        monthly_invest = np.minimum(
+            _capped_growth(start_monthly_investment, 1 + invest_hike_percent / 100, k, self.invest_monthly_cap),
+            self.invest_monthly_cap
+        )
 
-        # Build result dictionary with all metrics
-        result = {
-            "year": 0,
-            "gross_yearly": round(gross_yearly),
-            "gross_monthly": round(gross_monthly),
-            "tax_yearly": round(tax_yearly),
-            "tax_monthly": round(tax_monthly),
-            "net_salary_yearly": round(net_salary_yearly),
-            "net_monthly": round(net_monthly),
-            "common_ded_month": round(common_ded_month),
-            "other_deductions": round(other_deductions),
-            "total_invest_yearly": round(total_invest_yearly),
-            "monthly_investment": round(monthly_investment_capped),
-            "salary_left_month": round(salary_left_month),
-            "invest_percentage": round(invest_percentage, 2),
-            "remarks": remarks,
-            "running_invest_total": round(running_invest_total),
-            "cumulative_return": round(cumulative_return),
-            "return_percentage": round(return_percentage, 2)
+        # Calculate salary components for all scenarios and years at once
+        basic = 0.40 * gross
+        emp_pf = 0.12 * basic
+        employer_pf = 0.12 * basic
+        prof_tax_yearly = self.PROF_TAX_MONTH * 12
+        tax_yearly = tax_calc.compute_tax_vec(gross)
+
+        common_ded_month = (emp_pf + employer_pf + prof_tax_yearly) / 12
+        net_salary_yearly = gross - tax_yearly
+        net_monthly = net_salary_yearly / 12
+
+        salary_left_month = net_monthly - monthly_invest - common_ded_month - other_deductions
+        invest_percentage = np.zeros_like(net_monthly)
+        np.divide(monthly_invest * 100.0, net_monthly, out=invest_percentage, where=net_monthly > 0)
+
+        # Investment totals and compound returns. The recurrence C_y = (C_{y-1} + I_y) * q
+        # with q = 1 + r factors into C_y = q^(y+1) * sum_{k<=y} I_k * q^(-k)
+        total_invest_yearly = monthly_invest * 12
+        running_invest_total = np.cumsum(total_invest_yearly, axis=1)
+        with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+            cumulative_return = (np.cumsum(total_invest_yearly / return_factors, axis=1)
+                                 * return_factors * q)
+        # A -100% return wipes out the portfolio every year
+        cumulative_return = np.where(q == 0, 0.0, cumulative_return)
+        return_percentage = np.zeros_like(running_invest_total)
+        np.divide(
+            (cumulative_return - running_invest_total) * 100, running_invest_total,
+            out=return_percentage, where=running_invest_total > 0
+        )
+
+        # Collect the metric columns in record order
+        columns = {
+            "gross_yearly": gross,
+            "gross_monthly": gross / 12,
+            "tax_yearly": tax_yearly,
+            "tax_monthly": tax_yearly / 12,
+            "net_salary_yearly": net_salary_yearly,
+            "net_monthly": net_monthly,
+            "common_ded_month": common_ded_month,
+            "other_deductions": other_deductions,
+            "total_invest_yearly": total_invest_yearly,
+            "monthly_investment": monthly_invest,
+            "salary_left_month": salary_left_month,
+            "invest_percentage": invest_percentage,
+            "running_invest_total": running_invest_total,
+            "cumulative_return": cumulative_return,
+            "return_percentage": return_percentage
         }
 
-        return result, running_invest_total, cumulative_return
+        # Fill the preallocated record array column by column
+        out = np.empty(gross.shape, dtype=RESULT_DTYPE)
+        out["year"] = k + 1
+        out["remarks"] = np.where(invest_percentage > 40, "High", "Good")
+        for name, values in columns.items():
+            out[name] = values
+
+        return out
 
     def run_projection(
         self,
@@ -241,8 +710,9 @@ class SalaryInvestmentProjector:
         """
         Run multi-year salary and investment projection.
         
-        Iteratively projects financial metrics for each year, applying annual salary hikes
-        and investment increases while tracking compound returns.
+        List-of-dicts counterpart of run_projection_frame(), kept for callers that consume
+        one dictionary per year. The dictionaries are built straight from the record array,
+        without a pandas round-trip, so this path does not import pandas.
         
         Args:
             start_gross: Starting gross yearly salary in INR.
@@ -267,44 +737,123 @@ class SalaryInvestmentProjector:
             ... )
             >>> print(f"Year 1 net salary: ₹{projections[0]['net_salary_yearly']:,}")
         """
-        results: List[Dict[str, float]] = []
-        gross = float(start_gross)
-        monthly_invest = float(start_monthly_investment)
-        running_invest_total = 0.0
-        cumulative_return = 0.0
-
-        for y in range(1, years + 1):
-            # Project current year
-            res, running_invest_total, cumulative_return = self.project_year(
-                gross, monthly_invest, other_deductions,
-                running_invest_total, cumulative_return, expected_return
-            )
-            res["year"] = y
-            results.append(res)
-
-            # Apply annual hikes for next year (capped at salary_cap and invest_monthly_cap)
-            gross = min(gross * (1 + self.salary_hike_rate), self.SALARY_CAP)
-            monthly_invest = min(
-                monthly_invest * (1 + invest_hike_percent / 100),
-                self.invest_monthly_cap
-            )
-
-        return results
+        out = self._project_records(
+            start_gross, years, start_monthly_investment,
+            invest_hike_percent, expected_return, other_deductions
+        )[0]
+        # tolist() yields plain int/float/str values, one tuple per year
+        names = out.dtype.names
+        return [dict(zip(names, row)) for row in out.tolist()]
 
 
 # ============================================================================
 # Report Generation Functions: Text, Excel, and HTML exports
 # ============================================================================
 
-def save_report_text(projections: List[Dict[str, float]], filename: str = "report.txt") -> None:
+def _as_frame(projections: Union[List[Dict[str, float]], pd.DataFrame]) -> pd.DataFrame:
+    """
+    Return projections as a DataFrame, building one only when given a list of dictionaries.
+    
+    Lets the report functions share a single DataFrame instead of each re-parsing the
+    same list of yearly dictionaries.
+    
+    Args:
+        projections: DataFrame from run_projection_frame() or list of dictionaries from run_projection().
+    
+    Returns:
+        The DataFrame itself when one is passed, otherwise a new DataFrame.
+    """
+    import pandas as pd
+
+    if isinstance(projections, pd.DataFrame):
+        return projections
+    return pd.DataFrame(projections)
+
+
+def _export_frame(projections: Union[List[Dict[str, float]], pd.DataFrame]) -> pd.DataFrame:
+    """
+    Build the DataFrame written by the Excel and HTML reports.
+    
+    Puts the 'year' column first and applies the export rounding: amounts become whole
+    rupees and percentages keep two decimals.
+    
+    Args:
+        projections: Projection DataFrame from run_projection_frame() or list of dictionaries from run_projection().
+    
+    Returns:
+        Rounded DataFrame ready for export.
+    """
+    df = _as_frame(projections)
+    # Ensure 'year' column appears first, followed by other columns
+    if "year" in df.columns:
+        df = df[["year"] + [c for c in df.columns if c != "year"]]
+    return _round_for_export(df)
+
+
+def _round_for_export(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Apply the export rounding to the projection columns of a DataFrame.
+    
+    Amounts become whole rupees (int64, unless the column holds NaN) and percentages keep
+    two decimals; other columns are left as they are.
+    
+    Args:
+        df: DataFrame holding projection columns.
+    
+    Returns:
+        New DataFrame with the rounded columns; the given frame is not modified.
+    """
+    # Rounded columns are attached with assign(), which returns a new frame and never
+    # writes into a DataFrame passed in by the caller
+    rounded = {}
+    for c in df.columns:
+        if c in _ROUND_DECIMALS:
+            rounded[c] = df[c].round(_ROUND_DECIMALS[c])
+        elif c in _AMOUNT_FIELDS:
+            rounded[c] = df[c].round()
+            if rounded[c].notna().all():
+                rounded[c] = rounded[c].astype(np.int64)
+    return df.assign(**rounded)
+
+
+# Text report table layout: (field, column title, width, number format), in column order.
+# Amounts are printed as whole rupees and percentages with two decimals.
+_TEXT_COLUMNS = (
+    ("year", "Year", 5, ""),
+    ("gross_yearly", "Gross/Y", 10, ".0f"),
+    ("gross_monthly", "Gross/M", 10, ".0f"),
+    ("tax_yearly", "Tax/Y", 8, ".0f"),
+    ("tax_monthly", "Tax/M", 8, ".0f"),
+    ("net_salary_yearly", "Net/Y", 8, ".0f"),
+    ("net_monthly", "Net/M", 8, ".0f"),
+    ("common_ded_month", "Common Ded/M", 14, ".0f"),
+    ("other_deductions", "Other Ded/M", 13, ".0f"),
+    ("total_invest_yearly", "Invest/Y", 10, ".0f"),
+    ("monthly_investment", "Invest/M", 10, ".0f"),
+    ("invest_percentage", "Invest %", 10, ".2f"),
+    ("salary_left_month", "Salary Left/M", 13, ".0f"),
+    ("remarks", "Remarks", 8, ""),
+    ("running_invest_total", "Running Invest/Y", 16, ".0f"),
+    ("cumulative_return", "Cumulative Return/Y", 18, ".0f"),
+    ("return_percentage", "Return %", 12, ".2f"),
+)
+_TEXT_HEADER = "|".join(f"{title:<{width}}" for _, title, width, _ in _TEXT_COLUMNS)
+_TEXT_FIELDS = tuple(field for field, _, _, _ in _TEXT_COLUMNS)
+# One call fetches a row's values in column order; one call formats the whole row
+_TEXT_ROW_VALUES = operator.itemgetter(*_TEXT_FIELDS)
+_TEXT_ROW_FORMAT = "|".join(f"{{:<{width}{spec}}}" for _, _, width, spec in _TEXT_COLUMNS).format
+
+
+def save_report_text(projections: Union[List[Dict[str, float]], pd.DataFrame], filename: str = "report.txt") -> None:
     """
     Export projections to a formatted plain text file.
     
     Creates a comprehensive text report with column descriptions and formatted tabular data.
-    Columns are left-aligned with fixed widths for readability.
+    Columns are left-aligned with fixed widths for readability; amounts are printed as whole
+    rupees and percentages with two decimals.
     
     Args:
-        projections: List of yearly projection dictionaries from run_projection().
+        projections: Projection DataFrame from run_projection_frame() or list of dictionaries from run_projection().
         filename: Output filename for the text report (default: "report.txt").
     
     Returns:
@@ -315,26 +864,6 @@ def save_report_text(projections: List[Dict[str, float]], filename: str = "repor
         >>> save_report_text(projections, "my_report.txt")
         # Creates a formatted text file with salary and investment data
     """
-    widths = {
-        "year": 5,
-        "gross_yearly": 10,
-        "gross_monthly": 10,
-        "tax_yearly": 8,
-        "tax_monthly": 8,
-        "net_salary_yearly": 8,
-        "net_monthly": 8,
-        "common_ded_month": 14,
-        "other_deductions": 13,
-        "total_invest_yearly": 10,
-        "monthly_investment": 10,
-        "salary_left_month": 13,
-        "invest_percentage": 10,
-        "remarks": 8,
-        "running_invest_total": 16,
-        "cumulative_return": 18,
-        "return_percentage": 12
-    }
-
     # Column descriptions explaining what each metric represents
     descriptions = [
         ("Gross/Y", "Total salary earned in the year before deductions."),
@@ -354,92 +883,59 @@ def save_report_text(projections: List[Dict[str, float]], filename: str = "repor
         ("Return %", "Percentage gain made on total invested amount.")
     ]
 
-    with open(filename, "w", encoding="utf-8") as f:
-        # Write column descriptions header
-        f.write("==== Column Descriptions ====\n")
-        for col, desc in descriptions:
-            f.write(f"{col:<20}: {desc}\n")
-        f.write("\n")
-
-        # Format and write table header
-        header = (
-            f"{'Year':<{widths['year']}}|"
-            f"{'Gross/Y':<{widths['gross_yearly']}}|"
-            f"{'Gross/M':<{widths['gross_monthly']}}|"
-            f"{'Tax/Y':<{widths['tax_yearly']}}|"
-            f"{'Tax/M':<{widths['tax_monthly']}}|"
-            f"{'Net/Y':<{widths['net_salary_yearly']}}|"
-            f"{'Net/M':<{widths['net_monthly']}}|"
-            f"{'Common Ded/M':<{widths['common_ded_month']}}|"
-            f"{'Other Ded/M':<{widths['other_deductions']}}|"
-            f"{'Invest/Y':<{widths['total_invest_yearly']}}|"
-            f"{'Invest/M':<{widths['monthly_investment']}}|"
-            f"{'Invest %':<{widths['invest_percentage']}}|"
-            f"{'Salary Left/M':<{widths['salary_left_month']}}|"
-            f"{'Remarks':<{widths['remarks']}}|"
-            f"{'Running Invest/Y':<{widths['running_invest_total']}}|"
-            f"{'Cumulative Return/Y':<{widths['cumulative_return']}}|"
-            f"{'Return %':<{widths['return_percentage']}}"
-        )
+    # Format each row with the precompiled template; DataFrames are read as plain tuples
+    if isinstance(projections, list):
+        rows = [_TEXT_ROW_FORMAT(*_TEXT_ROW_VALUES(p)) for p in projections]
+    else:
+        df = _as_frame(projections)
+        rows = [
+            _TEXT_ROW_FORMAT(*values)
+            for values in df[list(_TEXT_FIELDS)].itertuples(index=False, name=None)
+        ]
+
+    # Assemble the whole document (column descriptions, table header, data rows) as one list of lines
+    lines = ["==== Column Descriptions ===="]
+    lines.extend(f"{col:<20}: {desc}" for col, desc in descriptions)
+    lines.extend(["", _TEXT_HEADER, "-" * len(_TEXT_HEADER)])
+    lines.extend(rows)
 
-        f.write(header + "\n")
-        f.write("-" * len(header) + "\n")
-
-        # Write data rows for each year's projection
-        for p in projections:
-            row = (
-                f"{p['year']:<{widths['year']}}|"
-                f"{p['gross_yearly']:<{widths['gross_yearly']}}|"
-                f"{p['gross_monthly']:<{widths['gross_monthly']}}|"
-                f"{p['tax_yearly']:<{widths['tax_yearly']}}|"
-                f"{p['tax_monthly']:<{widths['tax_monthly']}}|"
-                f"{p['net_salary_yearly']:<{widths['net_salary_yearly']}}|"
-                f"{p['net_monthly']:<{widths['net_monthly']}}|"
-                f"{p['common_ded_month']:<{widths['common_ded_month']}}|"
-                f"{p['other_deductions']:<{widths['other_deductions']}}|"
-                f"{p['total_invest_yearly']:<{widths['total_invest_yearly']}}|"
-                f"{p['monthly_investment']:<{widths['monthly_investment']}}|"
-                f"{p['invest_percentage']:<{widths['invest_percentage']}.2f}|"
-                f"{p['salary_left_month']:<{widths['salary_left_month']}}|"
-                f"{p['remarks']:<{widths['remarks']}}|"
-                f"{p['running_invest_total']:<{widths['running_invest_total']}}|"
-                f"{p['cumulative_return']:<{widths['cumulative_return']}}|"
-                f"{p['return_percentage']:<{widths['return_percentage']}.2f}"
-            )
-            f.write(row + "\n")
+    with open(filename, "w", encoding="utf-8") as f:
+        # Single write for the entire report
+        f.write("\n".join(lines) + "\n")
 
     print(f"Report saved to {filename}")
 
 
-def save_report_excel(projections: List[Dict[str, float]], filename: str = "report.xlsx") -> None:
+def save_report_excel(projections: Union[List[Dict[str, float]], pd.DataFrame], filename: str = "report.xlsx") -> None:
     """
     Export projections to an Excel spreadsheet file.
     
     Creates an Excel file with properly ordered columns for easy viewing and analysis
-    in Excel or compatible spreadsheet applications.
+    in Excel or compatible spreadsheet applications. Uses the faster xlsxwriter engine
+    when it is installed, otherwise openpyxl.
     
     Args:
-        projections: List of yearly projection dictionaries from run_projection().
+        projections: Projection DataFrame from run_projection_frame() or list of dictionaries from run_projection().
         filename: Output filename for the Excel report (default: "report.xlsx").
     
     Returns:
         None. Prints success or error message.
         
     Raises:
-        Implicit exception if pandas or openpyxl is not installed.
+        Implicit exception if pandas or neither xlsxwriter nor openpyxl is installed.
     """
-    df = pd.DataFrame(projections)
-    # Ensure 'year' column appears first, followed by other columns
-    cols = ["year"] + [c for c in df.columns if c != "year"]
-    df = df[cols]
+    df = _export_frame(projections)
+    # xlsxwriter's constant_memory mode is not used: pandas writes cells column by column,
+    # and that mode silently drops anything not written in row order
+    engine = "xlsxwriter" if _HAS_XLSXWRITER else "openpyxl"
     try:
-        df.to_excel(filename, index=False)
+        df.to_excel(filename, index=False, engine=engine)
         print(f"Excel report saved to {filename}")
     except Exception as e:
         print(f"Failed to save Excel file: {e}")
 
 
-def save_report_html(projections: List[Dict[str, float]], filename: str = "report.html") -> None:
+def save_report_html(projections: Union[List[Dict[str, float]], pd.DataFrame], filename: str = "report.html") -> None:
     """
     Export projections to an HTML webpage with styled table.
     
@@ -447,27 +943,65 @@ def save_report_html(projections: List[Dict[str, float]], filename: str = "repor
     with a centered table format for clean presentation.
     
     Args:
-        projections: List of yearly projection dictionaries from run_projection().
+        projections: Projection DataFrame from run_projection_frame() or list of dictionaries from run_projection().
         filename: Output filename for the HTML report (default: "report.html").
     
     Returns:
         None. Prints success or error message.
     """
-    df = pd.DataFrame(projections)
-    html = df.to_html(index=False, justify="center")
+    df = _export_frame(projections)
     try:
-        with open(filename, "w", encoding="utf-8") as f:
+        with open(filename, "w", encoding="utf-8", buffering=1 << 16) as f:
             # Write HTML document structure with metadata
             f.write("<html><head><meta charset='utf-8'><title>Salary Projection Report</title></head><body>\n")
             f.write("<h2>Salary Projection Report</h2>\n")
-            f.write(html)
+            # Stream the table straight into the file instead of building it as a string first
+            df.to_html(buf=f, index=False, justify="center")
             f.write("\n</body></html>")
         print(f"HTML report saved to {filename}")
     except Exception as e:
         print(f"Failed to save HTML file: {e}")
 
 
-def generate_analytics(projections: List[Dict[str, float]], out_dir: str = "analytics") -> None:
+def calc_cagr(
+    start: Union[float, np.ndarray],
+    end: Union[float, np.ndarray],
+    years: Union[int, np.ndarray]
+) -> Union[float, np.ndarray]:
+    """
+    Calculate CAGR (Compound Annual Growth Rate).
+    
+    Works on scalars or on NumPy arrays that broadcast together, so CAGR for a whole batch
+    of scenarios is computed in one call. Any entry whose start or end value is not
+    positive, or whose year count is not positive, yields 0.0.
+    
+    Args:
+        start: Starting value(s).
+        end: Ending value(s).
+        years: Number of years.
+    
+    Returns:
+        CAGR as a percentage (e.g., 12.5 for 12.5%); a float for scalar inputs,
+        otherwise an array of the broadcast shape.
+        
+    Examples:
+        >>> calc_cagr(100_000, 200_000, 5)
+        14.869835499703509
+        >>> calc_cagr(np.array([100.0, 100.0]), np.array([121.0, 0.0]), 2)
+        array([10.,  0.])
+    """
+    start, end, years = np.broadcast_arrays(
+        np.asarray(start, dtype=float), np.asarray(end, dtype=float), np.asarray(years, dtype=float)
+    )
+    valid = (start > 0) & (end > 0) & (years > 0)
+    # Invalid entries use ratio 1 and exponent 0, which gives a CAGR of exactly 0
+    ratio = np.divide(end, start, out=np.ones(start.shape), where=valid)
+    exponent = np.divide(1.0, years, out=np.zeros(start.shape), where=valid)
+    cagr = (ratio ** exponent - 1) * 100
+    return float(cagr) if cagr.ndim == 0 else cagr
+
+
+def generate_analytics(projections: Union[List[Dict[str, float]], pd.DataFrame], out_dir: str = "analytics") -> None:
     """
     Generate comprehensive financial analytics with visualizations and reports.
     
@@ -483,7 +1017,7 @@ def generate_analytics(projections: List[Dict[str, float]], out_dir: str = "anal
     The function generates seaborn heatmaps when available, with matplotlib fallback.
     
     Args:
-        projections: List of yearly projection dictionaries from run_projection().
+        projections: Projection DataFrame from run_projection_frame() or list of dictionaries from run_projection().
         out_dir: Output directory for analytics files (default: "analytics"). Directory is created if it doesn't exist.
     
     Returns:
@@ -493,117 +1027,201 @@ def generate_analytics(projections: List[Dict[str, float]], out_dir: str = "anal
         - Creates multiple PNG files for visualizations
         - Creates CSV files for data export
         - Creates text files for metrics (CAGR, milestones)
-        - Attempts to import seaborn; uses matplotlib fallback if unavailable
+        - Uses seaborn when installed, with a matplotlib fallback
+        - Selects the non-interactive Agg backend if pyplot has not been imported yet
+        - Saves the PNG files from a small thread pool
     """
-    # Attempt to import seaborn for enhanced heatmap visualization (optional)
-    try:
+    import pandas as pd
+    # pandas and seaborn plotting import pyplot; make sure it comes up with the Agg backend
+    _pyplot()
+    from matplotlib.figure import Figure
+
+    # Use seaborn for enhanced heatmap visualization when it is installed (optional)
+    if _HAS_SEABORN:
         import seaborn as sns
-    except Exception:
+    else:
         sns = None
 
-    if not projections:
+    df = _as_frame(projections)
+    if df.empty:
         print("No projections provided to generate analytics.")
         return
 
     # Create output directory for analytics files
     os.makedirs(out_dir, exist_ok=True)
 
-    # Convert projections to DataFrame and ensure numeric types
-    df = pd.DataFrame(projections)
+    # Small text outputs (file name -> (label, contents)) are written together at the end
+    text_files: Dict[str, Tuple[str, str]] = {}
+
+    # Set year as index for time-series analysis (a new frame, so the caller's data is untouched)
+    if "year" in df.columns:
+        df = df.set_index("year")
+
+    # Ensure numeric types
     numeric_cols = [
         "gross_yearly", "gross_monthly", "tax_yearly", "tax_monthly", "net_salary_yearly",
         "net_monthly", "common_ded_month", "other_deductions", "total_invest_yearly",
         "monthly_investment", "salary_left_month", "invest_percentage", "running_invest_total",
         "cumulative_return", "return_percentage"
     ]
-    for c in numeric_cols:
-        if c in df.columns:
-            df[c] = pd.to_numeric(df[c], errors="coerce")
+    # Projections are normally float already, so only non-numeric columns are converted
+    coerced = {
+        c: pd.to_numeric(df[c], errors="coerce")
+        for c in numeric_cols
+        if c in df.columns and not pd.api.types.is_numeric_dtype(df[c])
+    }
+    if coerced:
+        df = df.assign(**coerced)
 
-    # Set year as index for time-series analysis
-    if "year" in df.columns:
-        df.set_index("year", inplace=True)
+    # Analyse the values as exported: whole-rupee amounts and two-decimal percentages, so
+    # summary_stats.csv, projections_table.csv and the derived metrics carry no float noise
+    df = _round_for_export(df)
 
     # ========================== SUMMARY STATISTICS ==========================
     print("\n--- Summary Statistics ---")
     numeric_df = df.select_dtypes(include="number")
-    numeric_stats = numeric_df.describe().T
+    # Same table as describe().T, computed column-wise on one float matrix; the three
+    # quartiles come from a single nanquantile call instead of one sort per percentile.
+    # Like describe(), a single-year or all-NaN column silently yields NaN statistics.
+    values = numeric_df.to_numpy(dtype=float)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)
+        q25, q50, q75 = np.nanquantile(values, [0.25, 0.5, 0.75], axis=0)
+        numeric_stats = pd.DataFrame({
+            "count": np.count_nonzero(~np.isnan(values), axis=0).astype(float),
+            "mean": np.nanmean(values, axis=0),
+            "std": np.nanstd(values, axis=0, ddof=1),
+            "min": np.nanmin(values, axis=0),
+            "25%": q25,
+            "50%": q50,
+            "75%": q75,
+            "max": np.nanmax(values, axis=0),
+        }, index=numeric_df.columns)
     print(numeric_stats[["count", "mean", "std", "min", "25%", "50%", "75%", "max"]])
 
     stats_csv = os.path.join(out_dir, "summary_stats.csv")
     numeric_stats.to_csv(stats_csv)
     print(f"Summary statistics saved to {stats_csv}")
 
+    # ========================== DERIVED METRICS ==========================
+    # Compute all derived columns on plain ndarrays and attach them in a single assign()
+    def _pct_change(values: np.ndarray) -> np.ndarray:
+        """Year-over-year percentage change; NaN for the first year."""
+        change = np.empty(len(values))
+        change[:1] = np.nan
+        # Divide straight into the output buffer, then finish in place: no temporaries
+        tail = change[1:]
+        np.divide(values[1:], values[:-1], out=tail)
+        tail -= 1
+        tail *= 100
+        return change
+
+    col = {c: numeric_df[c].to_numpy(dtype=float) for c in numeric_df.columns}
+    derived: Dict[str, np.ndarray] = {}
+    with np.errstate(divide="ignore", invalid="ignore"):
+        if {"cumulative_return", "total_invest_yearly"}.issubset(col):
+            # Yearly return = current cumulative - (previous cumulative + current year investment)
+            prev_cum = np.concatenate(([0.0], col["cumulative_return"][:-1]))
+            derived["yearly_return"] = col["cumulative_return"] - (prev_cum + col["total_invest_yearly"])
+        if {"gross_yearly", "total_invest_yearly"}.issubset(col):
+            derived["salary_hike_pct"] = _pct_change(col["gross_yearly"])
+            derived["invest_hike_pct"] = _pct_change(col["total_invest_yearly"])
+        if {"salary_left_month", "gross_yearly"}.issubset(col):
+            derived["savings_rate"] = col["salary_left_month"] * 12 / col["gross_yearly"]
+        if {"tax_yearly", "gross_yearly"}.issubset(col):
+            derived["effective_tax_rate_pct"] = col["tax_yearly"] / col["gross_yearly"] * 100
+        if {"cumulative_return", "running_invest_total"}.issubset(col):
+            # Kept in the columns' own dtype, so whole-rupee inputs give a whole-rupee profit
+            derived["profit"] = (numeric_df["cumulative_return"].to_numpy()
+                                 - numeric_df["running_invest_total"].to_numpy())
+    numeric_df = numeric_df.assign(**derived)
+
     # ========================== PLOTS & VISUALIZATION HELPER ==========================
-    def _save_fig(fig_path: str) -> None:
+    # Each chart gets its own standalone Figure (no pyplot state); the finished figures
+    # are saved together at the end so PNG encoding can overlap across threads
+    fig_jobs: List[Tuple[Figure, str]] = []
+
+    def _new_axes(size: Optional[Tuple[float, float]] = None):
         """
-        Helper function to save matplotlib figures with error handling.
+        Create a standalone figure and return its axes for the next chart.
         
         Args:
+            size: Optional figure size in inches; defaults to matplotlib's default size.
+        """
+        return Figure(figsize=size).add_subplot()
+
+    def _queue_fig(ax, fig_path: str) -> None:
+        """
+        Lay out a finished chart and queue its figure for saving.
+        
+        Args:
+            ax: Axes of the finished chart.
             fig_path: Absolute path where the figure should be saved.
         """
+        fig = ax.get_figure()
+        fig.tight_layout()
+        fig_jobs.append((fig, fig_path))
+
+    def _save_fig(job: Tuple[Figure, str]) -> str:
+        """
+        Helper function to save one queued matplotlib figure with error handling.
+        
+        Args:
+            job: (figure, absolute path) pair queued by _queue_fig().
+        
+        Returns:
+            Progress message to print for this figure.
+        """
+        fig, fig_path = job
         try:
-            plt.tight_layout()
-            plt.savefig(fig_path)
-            plt.close()
-            print(f"Saved plot: {fig_path}")
+            fig.savefig(fig_path)
+            return f"Saved plot: {fig_path}"
         except Exception as e:
-            print(f"Failed to save {fig_path}: {e}")
-            plt.close()
+            return f"Failed to save {fig_path}: {e}"
 
     # ========================== INDIVIDUAL VISUALIZATIONS ==========================
     
     # 1) Gross Yearly Salary Trend
     if "gross_yearly" in numeric_df.columns:
-        plt.figure()
-        numeric_df["gross_yearly"].plot(marker="o", title="Gross Yearly Salary")
-        plt.xlabel("Year"); plt.ylabel("Amount (INR)")
-        _save_fig(os.path.join(out_dir, "gross_yearly.png"))
+        ax = _new_axes()
+        numeric_df["gross_yearly"].plot(ax=ax, marker="o", title="Gross Yearly Salary")
+        ax.set_xlabel("Year"); ax.set_ylabel("Amount (INR)")
+        _queue_fig(ax, os.path.join(out_dir, "gross_yearly.png"))
 
     # 2) Cumulative Return Over Years
     if "cumulative_return" in numeric_df.columns:
-        plt.figure()
-        numeric_df["cumulative_return"].plot(marker="o", title="Cumulative Return Over Years")
-        plt.xlabel("Year"); plt.ylabel("Amount (INR)")
-        _save_fig(os.path.join(out_dir, "cumulative_return.png"))
+        ax = _new_axes()
+        numeric_df["cumulative_return"].plot(ax=ax, marker="o", title="Cumulative Return Over Years")
+        ax.set_xlabel("Year"); ax.set_ylabel("Amount (INR)")
+        _queue_fig(ax, os.path.join(out_dir, "cumulative_return.png"))
 
     # 3) Investment Percentage of Net Monthly Salary
     if "invest_percentage" in numeric_df.columns:
-        plt.figure()
-        numeric_df["invest_percentage"].plot(marker="o", title="Investment % of Net Monthly")
-        plt.xlabel("Year"); plt.ylabel("% of Net Salary")
-        _save_fig(os.path.join(out_dir, "investment_percentage.png"))
+        ax = _new_axes()
+        numeric_df["invest_percentage"].plot(ax=ax, marker="o", title="Investment % of Net Monthly")
+        ax.set_xlabel("Year"); ax.set_ylabel("% of Net Salary")
+        _queue_fig(ax, os.path.join(out_dir, "investment_percentage.png"))
 
     # ========================== INVESTED VS RETURNS (Year-wise) ==========================
     # Calculates yearly return separately, not cumulative, for better insight
-    if {"cumulative_return", "total_invest_yearly"}.issubset(numeric_df.columns):
-        # Calculate previous cumulative (0 for year 1)
-        prev_cum = numeric_df["cumulative_return"].shift(1).fillna(0)
-        # Yearly return = current cumulative - (previous cumulative + current year investment)
-        yearly_return = numeric_df["cumulative_return"] - (prev_cum + numeric_df["total_invest_yearly"])
-        numeric_df["yearly_return"] = yearly_return
-
-        plt.figure()
-        plt.plot(numeric_df.index, numeric_df["total_invest_yearly"], marker="o", label="Invested (Year)")
-        plt.plot(numeric_df.index, numeric_df["yearly_return"], marker="o", label="Return (Year)")
-        plt.title("Invested vs Returns (Year-wise)")
-        plt.xlabel("Year"); plt.ylabel("Amount (INR)")
-        plt.grid(True); plt.legend()
-        _save_fig(os.path.join(out_dir, "invested_vs_returns_yearwise.png"))
+    if "yearly_return" in numeric_df.columns:
+        ax = _new_axes()
+        ax.plot(numeric_df.index, numeric_df["total_invest_yearly"], marker="o", label="Invested (Year)")
+        ax.plot(numeric_df.index, numeric_df["yearly_return"], marker="o", label="Return (Year)")
+        ax.set_title("Invested vs Returns (Year-wise)")
+        ax.set_xlabel("Year"); ax.set_ylabel("Amount (INR)")
+        ax.grid(True); ax.legend()
+        _queue_fig(ax, os.path.join(out_dir, "invested_vs_returns_yearwise.png"))
 
     # ========================== SALARY HIKE % VS INVESTMENT HIKE % ==========================
-    if "gross_yearly" in numeric_df.columns and "total_invest_yearly" in numeric_df.columns:
-        # Calculate percentage change year-over-year for both salary and investment
-        numeric_df["salary_hike_pct"] = numeric_df["gross_yearly"].pct_change() * 100
-        numeric_df["invest_hike_pct"] = numeric_df["total_invest_yearly"].pct_change() * 100
-
-        plt.figure()
-        plt.plot(numeric_df.index, numeric_df["salary_hike_pct"], marker="o", label="Salary Hike %")
-        plt.plot(numeric_df.index, numeric_df["invest_hike_pct"], marker="o", label="Investment Hike %")
-        plt.title("Salary Hike % vs Investment Hike %")
-        plt.xlabel("Year"); plt.ylabel("Percentage %")
-        plt.grid(True); plt.legend()
-        _save_fig(os.path.join(out_dir, "salary_vs_invest_hike_pct.png"))
+    if "salary_hike_pct" in numeric_df.columns:
+        ax = _new_axes()
+        ax.plot(numeric_df.index, numeric_df["salary_hike_pct"], marker="o", label="Salary Hike %")
+        ax.plot(numeric_df.index, numeric_df["invest_hike_pct"], marker="o", label="Investment Hike %")
+        ax.set_title("Salary Hike % vs Investment Hike %")
+        ax.set_xlabel("Year"); ax.set_ylabel("Percentage %")
+        ax.grid(True); ax.legend()
+        _queue_fig(ax, os.path.join(out_dir, "salary_vs_invest_hike_pct.png"))
 
     # ========================== PIE CHART: AVERAGE EXPENSE DISTRIBUTION ==========================
     # Compute average components for the pie chart visualization
@@ -620,124 +1238,115 @@ def generate_analytics(projections: List[Dict[str, float]], out_dir: str = "anal
 
     # Create pie chart only if data is available
     if sum(pie_values) > 0:
-        plt.figure()
-        plt.pie(pie_values, labels=pie_labels, autopct="%1.1f%%", startangle=90)
-        plt.title("Average Expense Distribution")
-        _save_fig(os.path.join(out_dir, "average_pie_chart.png"))
+        ax = _new_axes()
+        ax.pie(pie_values, labels=pie_labels, autopct="%1.1f%%", startangle=90)
+        ax.set_title("Average Expense Distribution")
+        _queue_fig(ax, os.path.join(out_dir, "average_pie_chart.png"))
     else:
         print("Pie chart skipped (no numeric data).")
 
     # ========================== CORRELATION HEATMAP ==========================
-    # Analyzes relationships between numeric columns (safe: only numeric columns)
-    corr_df = numeric_df.dropna(axis=1, how="all")  # Remove completely empty columns
+    # Analyzes relationships between numeric columns (safe: only numeric columns); the ratio
+    # and profit columns are derived from other columns and left out of the matrix
+    corr_df = numeric_df.drop(columns=["savings_rate", "effective_tax_rate_pct", "profit"], errors="ignore")
+    corr_df = corr_df.dropna(axis=1, how="all")  # Remove completely empty columns
     if corr_df.shape[1] >= 2:
         corr_mat = corr_df.corr()
-        plt.figure(figsize=(10, 6))
+        ax = _new_axes(size=(10, 6))
         if sns is not None:
             # Use seaborn for enhanced heatmap if available
-            sns.heatmap(corr_mat, annot=True, cmap="Blues")
+            sns.heatmap(corr_mat, annot=True, cmap="Blues", ax=ax)
         else:
             # Fallback to matplotlib-only implementation
-            plt.imshow(corr_mat, cmap="Blues", aspect="auto")
-            plt.colorbar()
+            image = ax.imshow(corr_mat, cmap="Blues", aspect="auto")
+            ax.get_figure().colorbar(image, ax=ax)
             ticks = range(len(corr_mat.columns))
-            plt.xticks(ticks, corr_mat.columns, rotation=45, ha="right")
-            plt.yticks(ticks, corr_mat.columns)
-            # Add correlation values as text annotations
-            for i in range(len(corr_mat.columns)):
-                for j in range(len(corr_mat.columns)):
-                    plt.text(j, i, f"{corr_mat.iloc[i, j]:.2f}", ha="center", va="center", color="black")
-        plt.title("Correlation Matrix (Numeric Columns Only)")
-        _save_fig(os.path.join(out_dir, "correlation_heatmap.png"))
+            ax.set_xticks(ticks)
+            ax.set_xticklabels(corr_mat.columns, rotation=45, ha="right")
+            ax.set_yticks(ticks)
+            ax.set_yticklabels(corr_mat.columns)
+            # Add correlation values as text annotations in one pass over the raw matrix
+            for (i, j), value in np.ndenumerate(corr_mat.to_numpy()):
+                ax.text(j, i, f"{value:.2f}", ha="center", va="center", color="black")
+        ax.set_title("Correlation Matrix (Numeric Columns Only)")
+        _queue_fig(ax, os.path.join(out_dir, "correlation_heatmap.png"))
     else:
         print("Not enough numeric columns for correlation heatmap.")
 
     # ========================== CAGR CALCULATIONS ==========================
     # Calculate Compound Annual Growth Rate for invested amounts and portfolio returns
     if "running_invest_total" in numeric_df.columns and "cumulative_return" in numeric_df.columns:
-        first_inv = numeric_df["running_invest_total"].iloc[0]
-        last_inv = numeric_df["running_invest_total"].iloc[-1]
-        first_ret = numeric_df["cumulative_return"].iloc[0]
-        last_ret = numeric_df["cumulative_return"].iloc[-1]
+        growth = numeric_df[["running_invest_total", "cumulative_return"]].to_numpy()
         yrs = max(1, len(numeric_df))
 
-        def calc_cagr(start: float, end: float, yrs: int) -> float:
-            """
-            Calculate CAGR (Compound Annual Growth Rate).
-            
-            Args:
-                start: Starting value
-                end: Ending value
-                yrs: Number of years
-            
-            Returns:
-                CAGR as a percentage (e.g., 12.5 for 12.5%)
-            """
-            try:
-                return ((end / start) ** (1 / yrs) - 1) * 100 if start > 0 and end > 0 else 0.0
-            except Exception:
-                return 0.0
-
-        invest_cagr = calc_cagr(first_inv, last_inv, yrs)
-        return_cagr = calc_cagr(first_ret, last_ret, yrs)
-
-        # Save CAGR calculations to text file
-        with open(os.path.join(out_dir, "cagr.txt"), "w", encoding="utf-8") as f:
-            f.write(f"Investment CAGR: {invest_cagr:.2f}%\n")
-            f.write(f"Returns CAGR: {return_cagr:.2f}%\n")
-        print(f"CAGR written to {os.path.join(out_dir, 'cagr.txt')}")
+        # Both CAGRs in one vectorized call: first vs last row of each column
+        invest_cagr, return_cagr = calc_cagr(growth[0], growth[-1], yrs)
+
+        # Queue CAGR calculations for the text file
+        text_files["cagr.txt"] = ("CAGR", f"Investment CAGR: {invest_cagr:.2f}%\n"
+                                          f"Returns CAGR: {return_cagr:.2f}%\n")
 
     # ========================== FINANCIAL METRICS TRENDS ==========================
     # Calculate and visualize key financial ratios and metrics over time
     
     # Savings Rate: Amount saved each month relative to yearly gross salary
-    if "salary_left_month" in numeric_df.columns and "gross_yearly" in numeric_df.columns:
-        numeric_df["savings_rate"] = (numeric_df["salary_left_month"] * 12) / numeric_df["gross_yearly"]
-        plt.figure()
-        numeric_df["savings_rate"].plot(marker="o", title="Savings Rate Over Years")
-        plt.xlabel("Year"); plt.ylabel("Savings Rate (fraction)")
-        _save_fig(os.path.join(out_dir, "savings_rate.png"))
+    if "savings_rate" in numeric_df.columns:
+        ax = _new_axes()
+        numeric_df["savings_rate"].plot(ax=ax, marker="o", title="Savings Rate Over Years")
+        ax.set_xlabel("Year"); ax.set_ylabel("Savings Rate (fraction)")
+        _queue_fig(ax, os.path.join(out_dir, "savings_rate.png"))
 
     # Effective Tax Rate: Percentage of gross salary paid as tax
-    if "tax_yearly" in numeric_df.columns and "gross_yearly" in numeric_df.columns:
-        numeric_df["effective_tax_rate_pct"] = numeric_df["tax_yearly"] / numeric_df["gross_yearly"] * 100
-        plt.figure()
-        numeric_df["effective_tax_rate_pct"].plot(marker="o", title="Effective Tax Rate (%) Over Years")
-        plt.xlabel("Year"); plt.ylabel("Tax %")
-        _save_fig(os.path.join(out_dir, "effective_tax_rate.png"))
+    if "effective_tax_rate_pct" in numeric_df.columns:
+        ax = _new_axes()
+        numeric_df["effective_tax_rate_pct"].plot(ax=ax, marker="o", title="Effective Tax Rate (%) Over Years")
+        ax.set_xlabel("Year"); ax.set_ylabel("Tax %")
+        _queue_fig(ax, os.path.join(out_dir, "effective_tax_rate.png"))
 
     # Portfolio Return Percentage: Growth percentage of investments
     if "return_percentage" in numeric_df.columns:
-        plt.figure()
-        numeric_df["return_percentage"].plot(marker="o", title="Return % (Portfolio) Over Years")
-        plt.xlabel("Year"); plt.ylabel("Return %")
-        _save_fig(os.path.join(out_dir, "return_percentage.png"))
+        ax = _new_axes()
+        numeric_df["return_percentage"].plot(ax=ax, marker="o", title="Return % (Portfolio) Over Years")
+        ax.set_xlabel("Year"); ax.set_ylabel("Return %")
+        _queue_fig(ax, os.path.join(out_dir, "return_percentage.png"))
+
+    # Save all queued charts; messages are printed in chart order
+    if fig_jobs:
+        with ThreadPoolExecutor(max_workers=min(4, len(fig_jobs))) as pool:
+            for message in pool.map(_save_fig, fig_jobs):
+                print(message)
 
     # ========================== KEY MILESTONES ==========================
     # Track important financial milestones such as positive returns and salary peaks
-    if {"cumulative_return", "running_invest_total"}.issubset(numeric_df.columns):
-        # Calculate profit (returns vs invested)
-        numeric_df["profit"] = numeric_df["cumulative_return"] - numeric_df["running_invest_total"]
-        crossing = numeric_df[numeric_df["profit"] > 0]
-        
-        with open(os.path.join(out_dir, "milestones.txt"), "w", encoding="utf-8") as f:
-            # Write milestone: when portfolio returns turn positive
-            if not crossing.empty:
-                f.write(f"Returns surpassed investments in Year: {crossing.index[0]}\n")
-            else:
-                f.write("Returns have NOT surpassed investments yet.\n")
-            
-            # Write salary peaks and troughs
-            if "net_salary_yearly" in numeric_df.columns:
-                f.write(f"Max Net Salary Year: {numeric_df['net_salary_yearly'].idxmax()}\n")
-                f.write(f"Min Net Salary Year: {numeric_df['net_salary_yearly'].idxmin()}\n")
-        print(f"Milestones written to {os.path.join(out_dir, 'milestones.txt')}")
+    if "profit" in numeric_df.columns:
+        # First year with positive profit, located on the raw mask without filtering rows
+        in_profit = numeric_df["profit"].to_numpy() > 0
+        milestones = []
+
+        # Milestone: when portfolio returns turn positive
+        if in_profit.any():
+            milestones.append(f"Returns surpassed investments in Year: {numeric_df.index[in_profit.argmax()]}\n")
+        else:
+            milestones.append("Returns have NOT surpassed investments yet.\n")
+
+        # Salary peaks and troughs
+        if "net_salary_yearly" in numeric_df.columns:
+            milestones.append(f"Max Net Salary Year: {numeric_df['net_salary_yearly'].idxmax()}\n")
+            milestones.append(f"Min Net Salary Year: {numeric_df['net_salary_yearly'].idxmin()}\n")
+        text_files["milestones.txt"] = ("Milestones", "".join(milestones))
 
     # ========================== EXPORT FINAL DATA ==========================
     # Save complete projection table with all computed columns for further analysis
     numeric_df.to_csv(os.path.join(out_dir, "projections_table.csv"))
     print(f"Projection table saved to {os.path.join(out_dir, 'projections_table.csv')}")
 
+    # Write the queued small text files, one open and one write each
+    for name, (label, payload) in text_files.items():
+        path = os.path.join(out_dir, name)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(payload)
+        print(f"{label} written to {path}")
+
     print("\nAdvanced analytics generated successfully.")
 
 
@@ -751,6 +1360,8 @@ def main() -> None:
     
     Prompts the user for financial parameters, runs the projection, and generates
     reports in multiple formats (text, Excel, HTML) along with comprehensive analytics.
+    When stdin is not a terminal (piped or redirected), the six values are read in one go
+    as whitespace-separated numbers, in the order below, without printing prompts.
     
     User Inputs:
         - Current yearly gross salary (INR)
@@ -770,13 +1381,22 @@ def main() -> None:
         None. Exits early on input error.
     """
     try:
-        # Collect user inputs with validation
-        gross = float(input("Enter current yearly gross salary (INR): ").strip())
-        monthly_invest = float(input("Enter current monthly investment (INR): ").strip())
-        years = int(input("Enter number of years to project: ").strip())
-        invest_hike_percent = float(input("Enter expected % increase in investment per year: ").strip())
-        expected_return = float(input("Enter expected annual return %: ").strip())
-        other_deductions = float(input("Enter other deductions per month (INR): ").strip())
+        if not sys.stdin.isatty():
+            # Scripted run: read all six values at once and skip the prompts
+            values = sys.stdin.read().split()
+            if len(values) != 6:
+                raise ValueError(f"expected 6 values, got {len(values)}")
+            gross, monthly_invest = float(values[0]), float(values[1])
+            years = int(values[2])
+            invest_hike_percent, expected_return, other_deductions = map(float, values[3:])
+        else:
+            # Collect user inputs with validation
+            gross = float(input("Enter current yearly gross salary (INR): ").strip())
+            monthly_invest = float(input("Enter current monthly investment (INR): ").strip())
+            years = int(input("Enter number of years to project: ").strip())
+            invest_hike_percent = float(input("Enter expected % increase in investment per year: ").strip())
+            expected_return = float(input("Enter expected annual return %: ").strip())
+            other_deductions = float(input("Enter other deductions per month (INR): ").strip())
     except Exception:
         print("Invalid input. Enter correct numeric values.")
         return
@@ -784,8 +1404,8 @@ def main() -> None:
     # Create projector instance with default settings
     projector = SalaryInvestmentProjector()
     
-    # Run projection for specified years
-    projections = projector.run_projection(
+    # Run projection for specified years; the one DataFrame is shared by every report
+    projections = projector.run_projection_frame(
         gross, years, monthly_invest, invest_hike_percent,
         expected_return, other_deductions
     )